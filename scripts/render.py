@@ -1,16 +1,25 @@
 import os
 import sys
 import glob
+import pathlib
+import functools
+import concurrent.futures
+import json
+import queue
 import yaml
 import subprocess
 import re
 from lxml import etree
-import base64
+import binascii
 import shutil
 from math import floor
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as YamlLoader
+
 SVG_NS = "http://www.w3.org/2000/svg"
-NS = {"svg": SVG_NS}
 
 # Geometry constants based on template
 MONOLITH_X = 923  # approximate vertical edge of monolith
@@ -20,15 +29,39 @@ TRACK_LETTER_SPACING_EM = 0.06  # from template CSS var --track
 FONT_LOGO = "DMSans-Variable"
 FONT_TEXT = "" #"DMSans-Variable"
 
-def parse_metadata_defaults(root) -> dict:
+# One C-level pass per value; &quot; keeps the result safe inside attributes too
+_XML_ESC = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;"})
+
+def xesc(s: str) -> str:
+    return s.translate(_XML_ESC)
+
+# Compiled once; the per-variable CSS patterns are filled in on first use
+_CSS_VAR_CACHE: dict[str, re.Pattern] = {}
+_ROOT_RE = re.compile(r"(:root\s*\{)")
+_SLOT_RE = re.compile(r"(@@[A-Z_]+@@)")
+
+def build_id_map(root) -> dict:
+    """
+    Indexes every element carrying an id in a single tree walk, so lookups
+    by id are dict probes instead of one XPath scan each.
+    """
+    return {el.get("id"): el for el in root.iter(etree.Element) if el.get("id")}
+
+def _require(id_map: dict, element_id: str):
+    el = id_map.get(element_id)
+    if el is None:
+        raise RuntimeError(f"Missing element id='{element_id}' in template")
+    return el
+
+def parse_metadata_defaults(id_map: dict) -> dict:
     """
     Reads <metadata id="release_vars">KEY=VALUE</metadata> into defaults.
     Ignores blank lines and lines without '='.
     """
-    nodes = root.xpath("//svg:metadata[@id='release_vars']", namespaces=NS)
-    if not nodes:
+    node = id_map.get("release_vars")
+    if node is None:
         return {}
-    text = nodes[0].text or ""
+    text = node.text or ""
     defaults = {}
     for raw in text.splitlines():
         line = raw.strip()
@@ -40,11 +73,8 @@ def parse_metadata_defaults(root) -> dict:
         defaults[k.strip()] = v.strip()
     return defaults
 
-def set_text(root, element_id: str, value: str):
-    el = root.xpath(f"//svg:*[@id='{element_id}']", namespaces=NS)
-    if not el:
-        raise RuntimeError(f"Missing element id='{element_id}' in template")
-    el[0].text = value
+def set_text(id_map: dict, element_id: str, value: str):
+    _require(id_map, element_id).text = value
 
 def clear_children(el):
     el.text = None
@@ -53,23 +83,24 @@ def clear_children(el):
         el.remove(child)
 
 def _wrap_words(text: str, max_chars: int) -> list[str]:
-    text = (text or "").strip()
-    if not text:
+    tokens = (text or "").split()
+    if not tokens:
         return [""]
-    words = re.split(r"(\s+)", text)
+    # Greedy pack on token lengths only; words are joined once per line
     lines = []
-    line = ""
-    for token in words:
-        if not token:
-            continue
-        candidate = line + token
-        if len(candidate.strip()) <= max_chars or not line:
-            line = candidate
+    cur: list[str] = []
+    cur_len = 0
+    for tok in tokens:
+        new_len = cur_len + (1 if cur else 0) + len(tok)
+        if new_len <= max_chars or not cur:
+            cur.append(tok)
+            cur_len = new_len
         else:
-            lines.append(line.strip())
-            line = token.strip()
-    if line.strip():
-        lines.append(line.strip())
+            lines.append(" ".join(cur))
+            cur = [tok]
+            cur_len = len(tok)
+    if cur:
+        lines.append(" ".join(cur))
     # Hard-break any single tokens that exceed max_chars (no spaces case)
     fixed = []
     for ln in lines:
@@ -84,41 +115,26 @@ def _wrap_words(text: str, max_chars: int) -> list[str]:
                 fixed.append(s)
     return fixed or [""]
 
-def set_wrapped_text(root, element_id: str, value: str, max_chars: int, max_lines: int | None = None) -> int:
-    el = root.xpath(f"//svg:*[@id='{element_id}']", namespaces=NS)
-    if not el:
-        raise RuntimeError(f"Missing element id='{element_id}' in template")
-    el = el[0]
-    clear_children(el)
-    x = el.get("x")
-    y = el.get("y")
-    font_size = float(el.get("font-size", "54"))
+def wrapped_tspans(x: str, y: str, value: str, max_chars: int, max_lines: int | None = None) -> tuple[str, int]:
+    """
+    Returns (tspan markup, line count) for value wrapped at max_chars, first baseline at y.
+    """
     lines = _wrap_words(value, max_chars)
     if max_lines and len(lines) > max_lines:
         # truncate with ellipsis on the last line
         lines = lines[:max_lines]
         lines[-1] = (lines[-1][:max(0, max_chars - 1)] + "…") if len(lines[-1]) >= max_chars else (lines[-1] + "…")
 
-    for i, ln in enumerate(lines):
-        tspan = etree.Element(f"{{{SVG_NS}}}tspan")
-        tspan.set("x", x)
-        if i == 0:
-            tspan.set("y", y)
-        else:
-            tspan.set("dy", "1.1em")
-        tspan.text = ln
-        el.append(tspan)
-    return len(lines)
-
-def set_multiline_block(root, element_id: str, header: str | None, items: list[str], max_chars: int, max_lines_total: int = 12, center_vertically: bool = False):
-    el = root.xpath(f"//svg:*[@id='{element_id}']", namespaces=NS)
-    if not el:
-        raise RuntimeError(f"Missing element id='{element_id}' in template")
-    el = el[0]
-    clear_children(el)
-    x = el.get("x")
-    y = float(el.get("y"))
-    font_size = float(el.get("font-size", "42"))
+    markup = "".join(
+        f'<tspan x="{x}" y="{y}">{xesc(ln)}</tspan>' if i == 0 else f'<tspan x="{x}" dy="1.1em">{xesc(ln)}</tspan>'
+        for i, ln in enumerate(lines)
+    )
+    return markup, len(lines)
+
+def multiline_tspans(x: str, y: float, font_size: float, header: str | None, items: list[str], max_chars: int, max_lines_total: int = 12, center_vertically: bool = False) -> str:
+    """
+    Returns tspan markup for a header plus wrapped items, optionally centred vertically on y.
+    """
     line_h = font_size * 1.1
 
     # Build all lines first
@@ -136,52 +152,53 @@ def set_multiline_block(root, element_id: str, header: str | None, items: list[s
         total_h = line_h * (len(lines) - 1)
         start_y = y - total_h / 2.0
 
-    # Emit tspans
-    for i, ln in enumerate(lines):
-        tspan = etree.Element(f"{{{SVG_NS}}}tspan")
-        tspan.set("x", x)
-        if i == 0:
-            tspan.set("y", str(start_y))
-        else:
-            tspan.set("dy", "1.1em")
-        tspan.text = ln
-        el.append(tspan)
-    return len(lines)
+    # Absolute baselines, same spacing as dy="1.1em"
+    return "".join(f'<tspan x="{x}" y="{round(start_y + i * line_h, 3)}">{xesc(ln)}</tspan>' for i, ln in enumerate(lines))
 
-def _estimate_max_chars_for_element(el, right_boundary_x: float, padding_px: float = 6.0) -> int:
-    x = float(el.get("x"))
-    font_size = float(el.get("font-size", "42"))
+@functools.lru_cache(maxsize=None)
+def _max_chars(font_size: float, x: float, right_boundary_x: float, padding_px: float) -> int:
     # Rough average glyph width + letter-spacing contribution
     char_px = font_size * (0.60 + TRACK_LETTER_SPACING_EM)
     width_px = max(0.0, right_boundary_x - padding_px - x)
-    est = max(8, int(width_px // max(1.0, char_px)))
-    return est
+    return max(8, int(width_px // max(1.0, char_px)))
+
+def _estimate_max_chars_for_element(el, right_boundary_x: float, padding_px: float = 6.0) -> int:
+    return _max_chars(float(el.get("font-size", "42")), float(el.get("x")), right_boundary_x, padding_px)
 
-def set_css_var_in_style(root, var_name: str, value: str):
+def set_css_var_in_style(id_map: dict, var_name: str, value: str):
     """
     Updates :root{ --var_name:...; } inside <style id="css_vars">.
     """
-    style_nodes = root.xpath("//svg:style[@id='css_vars']", namespaces=NS)
-    if not style_nodes:
+    style_el = id_map.get("css_vars")
+    if style_el is None:
         raise RuntimeError("Missing <style id='css_vars'> in template")
-    style_el = style_nodes[0]
     css = style_el.text or ""
 
-    # Replace existing var definition; if missing, inject into :root block.
-    pattern = rf"(--{re.escape(var_name)}\s*:\s*)([^;]+)(;)"
-    if re.search(pattern, css):
-        css = re.sub(pattern, rf"\g<1>{value}\g<3>", css, count=1)
+    # Fast path: the template writes vars as exact "--name:value;" literals
+    decl = f"--{var_name}:"
+    i = css.find(decl)
+    if i != -1:
+        j = css.find(";", i)
+        if j != -1:
+            style_el.text = css[:i] + decl + value + css[j:]
+            return
+
+    # Replace existing var definition (tolerating whitespace); if missing, inject into :root block.
+    pattern = _CSS_VAR_CACHE.get(var_name)
+    if pattern is None:
+        pattern = _CSS_VAR_CACHE[var_name] = re.compile(rf"(--{re.escape(var_name)}\s*:\s*)([^;]+)(;)")
+    if pattern.search(css):
+        css = pattern.sub(rf"\g<1>{value}\g<3>", css, count=1)
     else:
         # Insert into first :root{ ... } block
-        css = re.sub(r"(:root\s*\{)", rf"\1\n        --{var_name}:{value};", css, count=1)
+        css = _ROOT_RE.sub(rf"\1\n        --{var_name}:{value};", css, count=1)
 
     style_el.text = css
 
-def append_css_to_style(root, css_snippet: str):
-    style_nodes = root.xpath("//svg:style[@id='css_vars']", namespaces=NS)
-    if not style_nodes:
+def append_css_to_style(id_map: dict, css_snippet: str):
+    style_el = id_map.get("css_vars")
+    if style_el is None:
         raise RuntimeError("Missing <style id='css_vars'> in template")
-    style_el = style_nodes[0]
     existing = style_el.text or ""
     style_el.text = existing.rstrip() + "\n\n" + css_snippet.strip() + "\n"
 
@@ -195,10 +212,18 @@ def _mime_from_ext(path: str) -> str:
         return "font/otf"
     return "font/ttf"
 
-def embed_font_face(root, family: str, font_path: str, weight: str = "700", style: str = "normal"):
+@functools.lru_cache(maxsize=16)
+def _font_data_uri(font_path: str) -> tuple[str, str]:
+    """
+    Returns (mime, base64 payload) for a font file; encoded once per process
+    since every release embeds the same fonts.
+    """
     with open(font_path, "rb") as f:
-        b64 = base64.b64encode(f.read()).decode("ascii")
-    mime = _mime_from_ext(font_path)
+        b64 = binascii.b2a_base64(f.read(), newline=False).decode("ascii")
+    return _mime_from_ext(font_path), b64
+
+def embed_font_face(id_map: dict, family: str, font_path: str, weight: str = "700", style: str = "normal"):
+    mime, b64 = _font_data_uri(font_path)
     css = f"""
 @font-face {{
   font-family: '{family}';
@@ -208,18 +233,40 @@ def embed_font_face(root, family: str, font_path: str, weight: str = "700", styl
   font-display: swap;
 }}
 """
-    append_css_to_style(root, css)
+    append_css_to_style(id_map, css)
+
+# Optional custom fonts from repository: fonts/label.(ttf|otf|woff|woff2) and fonts/text.(ttf|otf|woff|woff2)
+def find_font(prefix: str):
+    base = os.path.join("fonts", prefix)
+    for ext in (".woff2", ".woff", ".otf", ".ttf"):
+        p = base + ext
+        if os.path.isfile(p):
+            return p
+    return None
 
 def _get_inkscape_bin() -> str | None:
     return os.environ.get("INKSCAPE_BIN") or shutil.which("inkscape")
 
-def inkscape_export(svg_path, out_png, out_pdf, px=3000):
-    if str(os.environ.get("SKIP_EXPORT", "")).lower() in {"1", "true", "yes"}:
+_MISSING_AT_RUNTIME_MSG = "Inkscape binary missing at runtime; skipping PNG/PDF export."
+
+def _env_flag(name: str) -> bool:
+    return str(os.environ.get(name, "")).lower() in {"1", "true", "yes"}
+
+def _export_bin() -> str | None:
+    """
+    Returns the Inkscape binary to export with, or None (after saying why) when export is skipped.
+    """
+    if _env_flag("SKIP_EXPORT"):
         print("SKIP_EXPORT set; skipping PNG/PDF export")
-        return
+        return None
     bin_path = _get_inkscape_bin()
     if not bin_path:
         print("Inkscape not found; skipping PNG/PDF export. Set INKSCAPE_BIN or install Inkscape.")
+    return bin_path
+
+def inkscape_export(svg_path, out_png, out_pdf, px=3000):
+    bin_path = _export_bin()
+    if not bin_path:
         return
     try:
         subprocess.check_call([
@@ -234,94 +281,243 @@ def inkscape_export(svg_path, out_png, out_pdf, px=3000):
             f"--export-filename={out_pdf}",
         ])
     except FileNotFoundError:
-        print("Inkscape binary missing at runtime; skipping PNG/PDF export.")
+        print(_MISSING_AT_RUNTIME_MSG)
         return
 
-def render_one(template_path, yml_path, out_root="rendered"):
-    with open(yml_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f) or {}
+class RenderSession:
+    """
+    Keeps one `inkscape --shell` process alive for a whole batch, so Inkscape
+    starts once and exports run while the next release is being prepared.
+    Set INKSCAPE_NO_SHELL=1 to fall back to one process per export.
+    """
+
+    def __init__(self, px=3000):
+        self.px = px
+        self.p = None
+        self.bin_path = None
+        self.per_file = False
+        self.pending = []  # (svg, png, pdf) sent to the shell, verified on exit
+
+    def __enter__(self):
+        if _env_flag("INKSCAPE_NO_SHELL"):
+            self.per_file = True
+            return self
+        self.bin_path = _export_bin()
+        if not self.bin_path:
+            return self
+        try:
+            self.p = subprocess.Popen([self.bin_path, "--shell"], stdin=subprocess.PIPE, stdout=subprocess.DEVNULL, text=True)
+        except FileNotFoundError:
+            print(_MISSING_AT_RUNTIME_MSG)
+        return self
+
+    def export(self, svg_path, out_png, out_pdf):
+        if self.per_file:
+            inkscape_export(svg_path, out_png, out_pdf, px=self.px)
+            return
+        if self.p is None:
+            return
+        if any(c in str(path) for path in (svg_path, out_png, out_pdf) for c in ";\n"):
+            # ';' and newlines delimit shell actions; pass such paths as argv instead
+            inkscape_export(svg_path, out_png, out_pdf, px=self.px)
+            return
+        # Each SVG is opened once and both formats are exported from the loaded document.
+        # Export options persist across the shell session; reset the width so the PDF keeps its default resolution.
+        self._send(
+            f"file-open:{svg_path}; export-filename:{out_png}; export-width:{self.px}; export-do; "
+            f"export-filename:{out_pdf}; export-width:0; export-do; file-close;\n"
+        )
+        self.pending.append((svg_path, out_png, out_pdf))
+
+    def _send(self, command: str):
+        try:
+            self.p.stdin.write(command)
+            self.p.stdin.flush()
+        except BrokenPipeError:
+            # Inkscape exited early; surface its exit status like check_call would
+            raise subprocess.CalledProcessError(self.p.wait(), [self.bin_path, "--shell"]) from None
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.p is None:
+            return False
+        if exc_type is not None:
+            self.p.kill()
+            self.p.wait()
+            return False
+        self._send("quit\n")
+        self.p.stdin.close()
+        if self.p.wait() != 0:
+            raise subprocess.CalledProcessError(self.p.returncode, [self.bin_path, "--shell"])
+
+        # A failed action only logs to stderr and the shell still exits 0, so check every output
+        missing = [
+            str(out)
+            for svg_path, out_png, out_pdf in self.pending
+            for out in (out_png, out_pdf)
+            if not os.path.isfile(out) or os.path.getmtime(out) < os.path.getmtime(svg_path)
+        ]
+        if missing:
+            raise RuntimeError(f"Inkscape shell did not export: {', '.join(missing)}")
+        return False
+
+def _write_bytes(path, buf: bytes):
+    """
+    Writes buf to path with raw os.write calls, bypassing Python's buffered file layer.
+    """
+    fd = os.open(path, os.O_CREAT | os.O_TRUNC | os.O_WRONLY, 0o644)
+    try:
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
-    parser = etree.XMLParser(remove_blank_text=False)
+def load_release(yml_path) -> dict:
+    """
+    Loads a release YAML, reusing a <yml>.cache.json sidecar while it is newer than the YAML.
+    """
+    cache_path = yml_path + ".cache.json"
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(yml_path):
+            with open(cache_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+    except (OSError, ValueError):
+        pass  # missing or unreadable cache; fall back to YAML
+
+    with open(yml_path, "r", encoding="utf-8") as f:
+        data = yaml.load(f, Loader=YamlLoader) or {}
+    try:
+        payload = json.dumps(data, ensure_ascii=False)
+        with open(cache_path, "w", encoding="utf-8") as f:
+            f.write(payload)
+    except (TypeError, OSError):
+        pass  # not JSON-representable (e.g. YAML dates) or read-only checkout; just skip caching
+    return data
+
+def load_template(template_path):
+    """
+    Parses the template; returns (tree, metadata defaults) for CompiledTemplate to build on.
+    """
+    # Blank text between elements is insignificant in the template; dropping it shrinks every copy.
+    # lxml's collect_ids only indexes DTD/xml:id ids, so SVG id lookups still go through build_id_map.
+    parser = etree.XMLParser(remove_blank_text=True, collect_ids=True, huge_tree=False)
     tree = etree.parse(template_path, parser)
-    root = tree.getroot()
+    return tree, parse_metadata_defaults(build_id_map(tree.getroot()))
 
-    defaults = parse_metadata_defaults(root)
+class CompiledTemplate:
+    """
+    The template serialized once with @@SLOT@@ sentinels at every per-release
+    insertion point, pre-split into literal parts and slot names so rendering a
+    release is a single join with no lxml work. Release-independent edits
+    (embedded fonts) are baked in here.
+    """
 
-    def get(key, fallback=""):
-        # YAML keys are lower-case in your schema; metadata uses UPPERCASE
-        # We'll check YAML first, then metadata, then fallback.
-        if key in data and data[key] is not None:
-            return str(data[key])
-        return str(defaults.get(key.upper(), fallback))
+    def __init__(self, template_path):
+        tree, self.defaults = load_template(template_path)
+        id_map = build_id_map(tree.getroot())
+
+        for element_id, slot in (
+            ("t_label", "@@T_LABEL@@"),
+            ("t_coord_lat", "@@T_COORD_LAT@@"),
+            ("t_coord_lon", "@@T_COORD_LON@@"),
+            ("t_bottom", "@@T_BOTTOM@@"),
+        ):
+            set_text(id_map, element_id, slot)
+
+        # Wrapped blocks: remember their geometry, then leave a slot for the tspan markup
+        artist_el = _require(id_map, "t_artist")
+        self.artist_x = artist_el.get("x")
+        self.artist_y = artist_el.get("y")
+
+        release_el = _require(id_map, "t_release")
+        self.release_x = release_el.get("x")
+        self.release_y = float(release_el.get("y", "585"))
+        self.release_line_h = float(release_el.get("font-size", "54")) * 1.1
+        release_el.set("y", "@@T_RELEASE_Y@@")
+
+        # Left column: compute max_chars so the longest wrapped lines end close to the monolith gap
+        tracks_a_el = _require(id_map, "t_tracks_a")
+        self.tracks_a = (tracks_a_el.get("x"), float(tracks_a_el.get("y")), float(tracks_a_el.get("font-size", "42")))
+        self.tracks_a_max_chars = _estimate_max_chars_for_element(tracks_a_el, right_boundary_x=MONOLITH_X - MONOLITH_GAP, padding_px=10.0)
+
+        tracks_b_el = _require(id_map, "t_tracks_b")
+        self.tracks_b = (tracks_b_el.get("x"), float(tracks_b_el.get("y")), float(tracks_b_el.get("font-size", "42")))
+
+        for el, slot in (
+            (artist_el, "@@T_ARTIST@@"),
+            (release_el, "@@T_RELEASE@@"),
+            (tracks_a_el, "@@T_TRACKS_A@@"),
+            (tracks_b_el, "@@T_TRACKS_B@@"),
+        ):
+            clear_children(el)
+            el.text = slot
+
+        set_css_var_in_style(id_map, "neon-bg", "@@NEON_BG@@")
+        set_css_var_in_style(id_map, "neon-ink", "@@NEON_INK@@")
+
+        label_font = find_font(FONT_LOGO)
+        text_font = find_font(FONT_TEXT)
+
+        # Embed fonts and set CSS variables to prefer them
+        fallback_stack = '"Roboto Condensed","Arial Narrow","DIN Condensed","Helvetica Neue Condensed",Arial,sans-serif'
+        if label_font:
+            embed_font_face(id_map, "RepoLabel", label_font, weight="700")
+            set_css_var_in_style(id_map, "font-label", f"'RepoLabel', {fallback_stack}")
+        if text_font:
+            embed_font_face(id_map, "RepoText", text_font, weight="700")
+            set_css_var_in_style(id_map, "font-text", f"'RepoText', {fallback_stack}")
+
+        svg = etree.tostring(tree, xml_declaration=True, encoding="UTF-8", pretty_print=False).decode("utf-8")
+        # Odd indices are slot names; split once so inserted values are never rescanned for slots
+        self.parts = _SLOT_RE.split(svg)
+
+def release_catalog(data: dict, defaults: dict) -> str:
+    """
+    The catalog a release renders under: YAML catalog (when not null), else the template's CATALOG.
+    """
+    catalog = data.get("catalog")
+    return str(catalog if catalog is not None else defaults.get("CATALOG", "UNKNOWN"))
 
-    # Required-ish: catalog
-    catalog = get("catalog", defaults.get("CATALOG", "UNKNOWN"))
-    out_dir = os.path.join(out_root, catalog)
-    os.makedirs(out_dir, exist_ok=True)
+def render_one(template: CompiledTemplate, yml_path, out_root="rendered"):
+    data = load_release(yml_path)
+    defaults = template.defaults
 
-    # Text substitutions
-    set_text(root, "t_label", get("label", "IMMUTABLE"))
+    # YAML keys are lower-case in your schema; metadata uses UPPERCASE.
+    # Merge once so YAML (when not null) wins over metadata for every field.
+    merged = {k.lower(): v for k, v in defaults.items()}
+    merged.update({k: v for k, v in data.items() if v is not None})
+
+    # Required-ish: catalog
+    catalog = release_catalog(data, defaults)
+    # main() creates every catalog directory up front, before the workers start
+    out_dir = pathlib.Path(out_root) / catalog
 
     coords = data.get("coords") or {}
     lat = coords.get("lat") or defaults.get("COORD_LAT", "")
     lon = coords.get("lon") or defaults.get("COORD_LON", "")
-    set_text(root, "t_coord_lat", str(lat))
-    set_text(root, "t_coord_lon", str(lon))
 
     # Artist/Release (replaces former serial/idx area). Fallback to legacy serial/idx if new fields absent.
-    artist_val = get('artist', defaults.get('ARTIST', ''))
-    release_val = get('release', defaults.get('RELEASE_NAME', ''))
+    artist_val = str(merged.get('artist', ''))
+    release_val = str(merged.get('release', defaults.get('RELEASE_NAME', '')))
     if not artist_val:
-        artist_val = f"SERIAL: {get('serial', defaults.get('SERIAL',''))}"
+        artist_val = f"SERIAL: {merged.get('serial', '')}"
     if not release_val:
-        release_val = f"IDX: {get('idx', defaults.get('IDX',''))}"
+        release_val = f"IDX: {merged.get('idx', '')}"
 
     # Wrap artist/release for a right-column width; tuned for font-size 54 and end-anchored text.
-    artist_lines = set_wrapped_text(root, "t_artist", artist_val, max_chars=16, max_lines=2)
+    artist_markup, artist_lines = wrapped_tspans(template.artist_x, template.artist_y, artist_val, max_chars=16, max_lines=2)
     # Shift release baseline if artist wrapped to maintain spacing
-    rel_nodes = root.xpath("//svg:*[@id='t_release']", namespaces=NS)
-    if rel_nodes:
-        rel_el = rel_nodes[0]
-        base_y = float(rel_el.get("y", "585"))
-        line_h = float(rel_el.get("font-size", "54")) * 1.1
-        new_y = base_y + (artist_lines - 1) * line_h
-        rel_el.set("y", str(new_y))
-    set_wrapped_text(root, "t_release", release_val, max_chars=16, max_lines=2)
+    release_y = str(template.release_y + (artist_lines - 1) * template.release_line_h)
+    release_markup, _ = wrapped_tspans(template.release_x, release_y, release_val, max_chars=16, max_lines=2)
     # Legacy code/sector removed from template; still available in YAML for reference.
 
-    bottom = f"{catalog} • {get('speed', defaults.get('SPEED','33⅓'))} • {get('genre', defaults.get('GENRE','HARDGROOVE'))}"
-    set_text(root, "t_bottom", bottom)
+    bottom = f"{catalog} • {merged.get('speed', '33⅓')} • {merged.get('genre', 'HARDGROOVE')}"
 
     # Colors (YAML overrides metadata)
     colors = data.get("colors") or {}
     bg = colors.get("bg") or defaults.get("COLOR_BG") or "#B7E718"
     ink = colors.get("ink") or defaults.get("COLOR_INK") or "#0A3DBB"
 
-    # Update CSS vars safely
-    set_css_var_in_style(root, "neon-bg", bg)
-    set_css_var_in_style(root, "neon-ink", ink)
-
-    # Optional custom fonts from repository: fonts/label.(ttf|otf|woff|woff2) and fonts/text.(ttf|otf|woff|woff2)
-    def find_font(prefix: str):
-        base = os.path.join("fonts", prefix)
-        for ext in (".woff2", ".woff", ".otf", ".ttf"):
-            p = base + ext
-            if os.path.isfile(p):
-                return p
-        return None
-
-    label_font = find_font(FONT_LOGO)
-    text_font = find_font(FONT_TEXT)
-
-    # Embed fonts and set CSS variables to prefer them
-    fallback_stack = '"Roboto Condensed","Arial Narrow","DIN Condensed","Helvetica Neue Condensed",Arial,sans-serif'
-    if label_font:
-        embed_font_face(root, "RepoLabel", label_font, weight="700")
-        set_css_var_in_style(root, "font-label", f"'RepoLabel', {fallback_stack}")
-    if text_font:
-        embed_font_face(root, "RepoText", text_font, weight="700")
-        set_css_var_in_style(root, "font-text", f"'RepoText', {fallback_stack}")
-
     # Tracks: two lists (Side A on left, Side B on right). Accepts either:
     # tracks: { A: [..], B: [..] } or tracks_a: [..] / tracks_b: [..] / side_a / side_b
     tracks = data.get("tracks") or {}
@@ -331,29 +527,66 @@ def render_one(template_path, yml_path, out_root="rendered"):
     tracks_b = tracks_b or data.get("tracks_b") or data.get("side_b") or []
 
     # Center-aligned columns with clip guards; keep conservative wrap to avoid touching monolith
-    # Left column: compute max_chars so the longest wrapped lines end close to the monolith gap
-    left_nodes = root.xpath("//svg:*[@id='t_tracks_a']", namespaces=NS)
-    if left_nodes:
-        left_el = left_nodes[0]
-        left_right_bound = MONOLITH_X - MONOLITH_GAP
-        max_chars_left = _estimate_max_chars_for_element(left_el, right_boundary_x=left_right_bound, padding_px=10.0)
-    else:
-        max_chars_left = 22
-    set_multiline_block(root, "t_tracks_a", "SIDE A", tracks_a, max_chars=max_chars_left, max_lines_total=15, center_vertically=True)
-
+    tracks_a_markup = multiline_tspans(*template.tracks_a, "SIDE A", tracks_a, max_chars=template.tracks_a_max_chars, max_lines_total=15, center_vertically=True)
     # Right column: keep conservative width; left-aligned starting at its x
-    set_multiline_block(root, "t_tracks_b", "SIDE B", tracks_b, max_chars=22, max_lines_total=15, center_vertically=True)
+    tracks_b_markup = multiline_tspans(*template.tracks_b, "SIDE B", tracks_b, max_chars=22, max_lines_total=15, center_vertically=True)
+
+    # Text values are escaped here; tspan markup is escaped as it is built
+    slots = {
+        "@@T_LABEL@@": xesc(str(merged.get("label", "IMMUTABLE"))),
+        "@@T_COORD_LAT@@": xesc(str(lat)),
+        "@@T_COORD_LON@@": xesc(str(lon)),
+        "@@T_ARTIST@@": artist_markup,
+        "@@T_RELEASE_Y@@": release_y,
+        "@@T_RELEASE@@": release_markup,
+        "@@T_BOTTOM@@": xesc(bottom),
+        "@@NEON_BG@@": xesc(str(bg)),
+        "@@NEON_INK@@": xesc(str(ink)),
+        "@@T_TRACKS_A@@": tracks_a_markup,
+        "@@T_TRACKS_B@@": tracks_b_markup,
+    }
+    out = "".join(slots[part] if i % 2 else part for i, part in enumerate(template.parts))
 
     # Write SVG
-    svg_out = os.path.join(out_dir, "label.svg")
-    tree.write(svg_out, xml_declaration=True, encoding="UTF-8", pretty_print=True)
+    svg_out = out_dir / "label.svg"
+    _write_bytes(svg_out, out.encode("utf-8"))
+
+    # PNG + PDF are exported by render_batch's export thread
+    png_out = out_dir / "label.png"
+    pdf_out = out_dir / "label.pdf"
 
-    # Render PNG + PDF
-    png_out = os.path.join(out_dir, "label.png")
-    pdf_out = os.path.join(out_dir, "label.pdf")
-    inkscape_export(svg_out, png_out, pdf_out, px=3000)
+    return svg_out, png_out, pdf_out
 
-    return out_dir
+def render_batch(template_path, yml_paths, out_root="rendered"):
+    """
+    Renders a shard of releases in one worker process and exports them
+    through that worker's own Inkscape session. Returns (yml, out_dir) pairs.
+
+    Exports run on a separate thread fed through a queue, so preparing the
+    next release overlaps with exporting the current one even when
+    INKSCAPE_NO_SHELL makes each export a blocking subprocess.
+    """
+    template = CompiledTemplate(template_path)
+    results = []
+    jobs = queue.Queue()
+
+    with RenderSession(px=3000) as sess, concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        def drain():
+            while (job := jobs.get()) is not None:
+                sess.export(*job)
+
+        exporter = pool.submit(drain)
+        try:
+            for yml in yml_paths:
+                if exporter.done():
+                    break  # export thread failed; stop preparing and surface its error below
+                svg_out, png_out, pdf_out = render_one(template, yml, out_root)
+                jobs.put((svg_out, png_out, pdf_out))
+                results.append((yml, svg_out.parent))
+        finally:
+            jobs.put(None)
+        exporter.result()
+    return results
 
 def main():
     template = sys.argv[1] if len(sys.argv) > 1 else "templates/label.template.svg"
@@ -364,8 +597,32 @@ def main():
         print(f"No releases found for glob: {releases_glob}")
         return 0
 
+    out_root = pathlib.Path("rendered")
+
+    # Releases sharing a catalog write the same output directory. Rendering them in
+    # different workers would race, so keep only the last in sorted order, which is
+    # the one whose output a sequential build would leave on disk.
+    _, defaults = load_template(template)
+    by_catalog = {}
     for yml in files:
-        out_dir = render_one(template, yml)
+        catalog = os.path.normpath(release_catalog(load_release(yml), defaults))
+        if catalog in by_catalog:
+            print(f"Skipping {by_catalog[catalog]}: {yml} also renders to {out_root / catalog}")
+        by_catalog[catalog] = yml
+    files = sorted(by_catalog.values())
+
+    # Created once here so render_one does no per-release directory work;
+    # parents covers out_root itself and catalogs containing "/"
+    for catalog in by_catalog:
+        (out_root / catalog).mkdir(parents=True, exist_ok=True)
+
+    # One shard per core; each shard feeds a single persistent Inkscape shell
+    workers = min(os.cpu_count() or 1, len(files))
+    shards = [files[i::workers] for i in range(workers)]
+    with concurrent.futures.ProcessPoolExecutor(max_workers=workers) as ex:
+        results = [r for shard in ex.map(functools.partial(render_batch, template, out_root=out_root), shards) for r in shard]
+
+    for yml, out_dir in sorted(results):
         print(f"Rendered {yml} -> {out_dir}")
 
     return 0